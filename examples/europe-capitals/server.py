@@ -1,8 +1,15 @@
 """European capitals with current time — served from an AegisVM microVM."""
 
 import json
-from datetime import datetime, timezone, timedelta
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import re
+import sys
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 CAPITALS = [
     ("Reykjavik",  "Iceland",        0),
@@ -41,36 +48,23 @@ CAPITALS = [
     ("Moscow",     "Russia",         3),
 ]
 
-def render_page():
-    now_utc = datetime.now(timezone.utc)
-    rows = []
-    for city, country, offset in CAPITALS:
-        local = now_utc + timedelta(hours=offset)
-        sign = "+" if offset >= 0 else ""
-        rows.append(
-            f"<tr>"
-            f"<td>{city}</td>"
-            f"<td>{country}</td>"
-            f"<td>UTC{sign}{offset}</td>"
-            f"<td>{local.strftime('%H:%M:%S')}</td>"
-            f"</tr>"
-        )
-    table_rows = "\n            ".join(rows)
-    return f"""<!DOCTYPE html>
+# Page template. {rows} and {now} are the only dynamic parts; the template is
+# split on them once at import, so a request just joins pre-encoded pieces.
+PAGE_SRC = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
     <title>European Capitals — Current Time</title>
     <meta http-equiv="refresh" content="30">
     <style>
-        body {{ font-family: -apple-system, system-ui, sans-serif; margin: 40px auto; max-width: 720px; color: #333; }}
-        h1 {{ font-size: 1.5em; margin-bottom: 4px; }}
-        .subtitle {{ color: #888; font-size: 0.9em; margin-bottom: 24px; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th {{ text-align: left; padding: 8px 12px; border-bottom: 2px solid #ddd; font-size: 0.85em; text-transform: uppercase; color: #666; }}
-        td {{ padding: 6px 12px; border-bottom: 1px solid #eee; }}
-        tr:hover {{ background: #f8f8f8; }}
-        .footer {{ margin-top: 24px; font-size: 0.8em; color: #aaa; }}
+        body { font-family: -apple-system, system-ui, sans-serif; margin: 40px auto; max-width: 720px; color: #333; }
+        h1 { font-size: 1.5em; margin-bottom: 4px; }
+        .subtitle { color: #888; font-size: 0.9em; margin-bottom: 24px; }
+        table { width: 100%; border-collapse: collapse; }
+        th { text-align: left; padding: 8px 12px; border-bottom: 2px solid #ddd; font-size: 0.85em; text-transform: uppercase; color: #666; }
+        td { padding: 6px 12px; border-bottom: 1px solid #eee; }
+        tr:hover { background: #f8f8f8; }
+        .footer { margin-top: 24px; font-size: 0.8em; color: #aaa; }
     </style>
 </head>
 <body>
@@ -81,26 +75,122 @@ def render_page():
             <tr><th>Capital</th><th>Country</th><th>Timezone</th><th>Local Time</th></tr>
         </thead>
         <tbody>
-            {table_rows}
+            {rows}
         </tbody>
     </table>
-    <p class="footer">Served from an AegisVM microVM at {now_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
+    <p class="footer">Served from an AegisVM microVM at {now} UTC</p>
 </body>
 </html>"""
 
+_PAGE_HEAD, _PAGE_MID, _PAGE_TAIL = (
+    part.encode() for part in re.split(r"\{rows\}|\{now\}", PAGE_SRC)
+)
+
+# Everything in a row except the local time is fixed per capital.
+_ROW_PREFIXES = [
+    f"<tr>"
+    f"<td>{city}</td>"
+    f"<td>{country}</td>"
+    f"<td>UTC{offset:+d}</td>"
+    f"<td>"
+    for city, country, offset in CAPITALS
+]
+_ROW_SUFFIX = "</td></tr>"
+
+# UTC offsets in seconds, parallel to _ROW_PREFIXES. Local times are derived
+# from these with integer arithmetic instead of per-row datetime objects.
+_OFFSET_SECONDS = [offset * 3600 for _, _, offset in CAPITALS]
+# The 34 capitals share only a handful of offsets; each is formatted once.
+_UNIQUE_OFFSETS = sorted(set(_OFFSET_SECONDS))
+
+
+def render_page(now):
+    """Render the page for *now*, a whole UTC epoch second."""
+    cells = {}
+    for offset in _UNIQUE_OFFSETS:
+        hh, rem = divmod((now + offset) % 86400, 3600)
+        mm, ss = divmod(rem, 60)
+        cells[offset] = f"{hh:02d}:{mm:02d}:{ss:02d}{_ROW_SUFFIX}"
+    rows = [prefix + cells[offset] for prefix, offset in zip(_ROW_PREFIXES, _OFFSET_SECONDS)]
+    return b"".join((
+        _PAGE_HEAD,
+        "\n            ".join(rows).encode(),
+        _PAGE_MID,
+        time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now)).encode(),
+        _PAGE_TAIL,
+    ))
+
+
+# (epoch second, encoded page). The page only changes when the clock ticks
+# over to the next second, so every request within a second reuses it.
+# Concurrent misses may both render; last writer wins, which is harmless.
+_page_cache = (0, b"")
+
+
+def page_bytes():
+    global _page_cache
+    now = int(time.time())
+    cached_now, body = _page_cache
+    if now != cached_now:
+        body = render_page(now)
+        _page_cache = (now, body)
+    return body
+
+
+_ts_cache = (0, "")
+
+
+def _timestamp():
+    """UTC ISO-8601 timestamp; the date/time prefix is reformatted once per second."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}{ns // 1000:06d}+00:00"
+
+
+def _dumps(entry):
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints wider than 64 bits; the stdlib encoder handles them
+    return json.dumps(entry)
+
 
 def log(level, msg, **kw):
-    entry = {"level": level, "msg": msg, "ts": datetime.now(timezone.utc).isoformat(), **kw}
-    print(json.dumps(entry), flush=True)
+    entry = {"level": level, "msg": msg, "ts": _timestamp(), **kw}
+    line = _dumps(entry)
+    # One write per line through sys.stdout: print() emits the newline
+    # separately, which lets lines from concurrent handler threads interleave,
+    # and writing to sys.stdout.buffer could overtake earlier print() output.
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
 
 
 class Handler(BaseHTTPRequestHandler):
+    # Buffer the response so the status line, headers and body leave in a
+    # single send when handle_one_request() flushes, not one send per piece.
+    wbufsize = -1
+    # HTTP/1.1 with an explicit Content-Length keeps connections open
+    # between requests instead of closing after every response. Clients that
+    # ask for HTTP/1.0 or Connection: close still get the socket closed.
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections so they do not pin handler threads.
+    timeout = 30
+
     def do_GET(self):
-        html = render_page()
+        body = page_bytes()
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(body)
+        # Send the buffered response now rather than after do_GET returns, so
+        # a slow stdout reader cannot delay it.
+        self.wfile.flush()
         log("info", "request served", path=self.path)
 
     def log_message(self, fmt, *args):
@@ -109,4 +199,4 @@ class Handler(BaseHTTPRequestHandler):
 
 if __name__ == "__main__":
     log("info", "starting europe-capitals server", port=80)
-    HTTPServer(("0.0.0.0", 80), Handler).serve_forever()
+    ThreadingHTTPServer(("0.0.0.0", 80), Handler).serve_forever()
@@ -1,14 +1,56 @@
 """Simple HTTP server — demonstrates serve mode, secrets, and workspace."""
 import os
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import sys
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ts_cache = (0, "")
+
+def _timestamp():
+    """UTC ISO-8601 timestamp; the date/time prefix is reformatted once per second."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}{ns // 1000:06d}+00:00"
+
+def _dumps(entry):
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints wider than 64 bits; the stdlib encoder handles them
+    return json.dumps(entry)
+
 def log(level, msg, **kwargs):
-    entry = {"level": level, "msg": msg, "ts": datetime.now(timezone.utc).isoformat(), **kwargs}
-    print(json.dumps(entry), flush=True)
+    entry = {"level": level, "msg": msg, "ts": _timestamp(), **kwargs}
+    line = _dumps(entry)
+    # One write per line through sys.stdout: print() emits the newline
+    # separately, which lets lines from concurrent handler threads interleave,
+    # and writing to sys.stdout.buffer could overtake earlier print() output.
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
 
 class Handler(BaseHTTPRequestHandler):
+    # Buffer the response so the status line, headers and body leave in a
+    # single send when handle_one_request() flushes, not one send per piece.
+    wbufsize = -1
+    # HTTP/1.1 with an explicit Content-Length keeps connections open
+    # between requests instead of closing after every response. Clients that
+    # ask for HTTP/1.0 or Connection: close still get the socket closed.
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections so they do not pin handler threads.
+    timeout = 30
+
     def do_GET(self):
         api_key = os.environ.get("API_KEY", "")
         has_key = "yes" if api_key else "no"
@@ -19,7 +61,7 @@ class Handler(BaseHTTPRequestHandler):
         if os.path.isdir(workspace):
             files = os.listdir(workspace)
 
-        body = f"""<html>
+        html = f"""<html>
 <body>
 <h1>AegisVM HTTP Server</h1>
 <p>API_KEY configured: {has_key}</p>
@@ -28,10 +70,15 @@ class Handler(BaseHTTPRequestHandler):
 </body>
 </html>"""
 
+        body = html.encode()
         self.send_response(200)
         self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(body.encode())
+        self.wfile.write(body)
+        # Send the buffered response now rather than after do_GET returns, so
+        # a slow stdout reader cannot delay it.
+        self.wfile.flush()
         log("info", "request served", path=self.path, method="GET")
 
     def log_message(self, format, *args):
@@ -39,5 +86,5 @@ class Handler(BaseHTTPRequestHandler):
 
 if __name__ == "__main__":
     log("info", "starting server", port=80)
-    server = HTTPServer(("0.0.0.0", 80), Handler)
+    server = ThreadingHTTPServer(("0.0.0.0", 80), Handler)
     server.serve_forever()
@@ -1,12 +1,30 @@
 """Simple task agent — demonstrates secrets, workspace, and logging conventions."""
 import os
 import json
-import sys
+import time
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _timestamp():
+    """UTC ISO-8601 timestamp with microseconds, without building a datetime."""
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))}.{ns // 1000:06d}+00:00"
+
+def _dumps(entry):
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints wider than 64 bits; the stdlib encoder handles them
+    return json.dumps(entry)
+
 def log(level, msg, **kwargs):
-    entry = {"level": level, "msg": msg, "ts": datetime.now(timezone.utc).isoformat(), **kwargs}
-    print(json.dumps(entry), flush=True)
+    entry = {"level": level, "msg": msg, "ts": _timestamp(), **kwargs}
+    print(_dumps(entry), flush=True)
 
 def main():
     log("info", "agent starting")
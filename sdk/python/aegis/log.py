@@ -1,24 +1,120 @@
 """Structured JSON logging to stdout/stderr for Aegis agents.
 
-Each function emits exactly one JSON line.
+Each function emits exactly one JSON line. If orjson is installed it is used
+for serialization; otherwise the stdlib json module is used.
 """
 
 from __future__ import annotations
 
+import codecs
 import json
+import os
 import sys
-from datetime import datetime, timezone
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - only runs when orjson is not installed
+    orjson = None
+
+# Shared stdlib encoder for the fallback path. json.dumps() with non-default
+# options builds a new JSONEncoder per call; the compact separators match
+# orjson's output.
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# (whole second, "YYYY-MM-DDTHH:MM:SS." prefix) of the last formatted timestamp.
+# Stored as one tuple so concurrent loggers never see a torn update.
+_ts_cache = (0, "")
+
+
+def _timestamp() -> str:
+    """Return the current UTC time in ISO-8601 form with microseconds."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}{ns // 1000:06d}+00:00"
+
+
+# Keys every record starts with. Extra fields that reuse one of these names
+# override it, which the hand-built line in _format_line cannot express.
+_BASE_KEYS = frozenset(("level", "msg", "ts"))
+
+
+def _format_line(level: str, msg: str, ts: str, kwargs: dict) -> str:
+    """Build the JSON line for the stdlib fallback without a merged record dict.
+
+    Output is identical to _ENCODER.encode({"level": ..., "msg": ..., "ts": ...,
+    **kwargs}); only msg and the extra fields go through the encoder.
+    """
+    line = '{"level":"%s","msg":%s,"ts":"%s"' % (level, _ENCODER.encode(msg), ts)
+    if kwargs:
+        return line + "," + _ENCODER.encode(kwargs)[1:] + "\n"
+    return line + "}\n"
+
+
+def _is_utf8(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _write(stream, line: str | bytes) -> None:
+    """Write *line* to *stream*'s file descriptor, or to the stream itself.
+
+    A line goes out in a single os.write() (atomic on POSIX pipes up to
+    PIPE_BUF), bypassing the TextIO layer's locking. str lines are encoded
+    with the stream's own encoding and errors handler, so surrogateescape'd
+    text and non-UTF-8 streams behave as with stream.write(); orjson's UTF-8
+    bytes take the descriptor path only on UTF-8 streams. Streams without a
+    real descriptor, such as io.StringIO, get a normal str write.
+    """
+    encoding = getattr(stream, "encoding", None)
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if isinstance(line, str):
+        if fd is None or encoding is None:
+            stream.write(line)
+            return
+        data = line.encode(encoding, getattr(stream, "errors", None) or "strict")
+    elif fd is None or encoding is None or not _is_utf8(encoding):
+        stream.write(line.decode())
+        return
+    else:
+        data = line
+    # Flush pending text so the raw write cannot overtake earlier print() output.
+    stream.flush()
+    while data:
+        data = data[os.write(fd, data):]
 
 
 def _emit(stream, level: str, msg: str, **kwargs) -> None:
     """Write a single JSON log line to *stream*."""
-    record = {
-        "level": level,
-        "msg": msg,
-        "ts": datetime.now(timezone.utc).isoformat(),
-    }
-    record.update(kwargs)
-    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    ts = _timestamp()
+    if orjson is None and _BASE_KEYS.isdisjoint(kwargs):
+        _write(stream, _format_line(level, msg, ts, kwargs))
+        return
+    # A single dict display builds the record in one allocation, with no
+    # separate update() call; extra fields still override the base keys.
+    record = {"level": level, "msg": msg, "ts": ts, **kwargs}
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects some values the stdlib accepts, e.g. ints wider
+            # than 64 bits; logging must not fail because it is installed.
+            pass
+        else:
+            _write(stream, payload)
+            return
+    _write(stream, _ENCODER.encode(record) + "\n")
 
 
 def info(msg: str, **kwargs) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 
 
@@ -14,6 +15,18 @@ def get_secret(name: str) -> str | None:
     return os.environ.get(name)
 
 
+@functools.lru_cache(maxsize=128)
+def get_secret_cached(name: str) -> str | None:
+    """Like get_secret(), but reads the environment only once per name.
+
+    Secrets are injected when the process starts and do not change while it
+    runs, so hot paths (e.g. request handlers) can use this to skip the
+    os.environ lookup. Changes to os.environ after the first call for a name
+    are not seen; call get_secret_cached.cache_clear() to reset.
+    """
+    return os.environ.get(name)
+
+
 def require_secret(name: str) -> str:
     """Get a secret by name. Raises AegisSecretError if not set."""
     try:
@@ -5,6 +5,11 @@ from __future__ import annotations
 import os
 
 
+# Fallback root chosen when AEGIS_WORKSPACE_PATH is unset. The /workspace mount
+# is in place before the agent starts, so it is only probed once per process.
+_default_root: str | None = None
+
+
 def workspace_path() -> str:
     """Return the workspace root.
 
@@ -12,33 +17,47 @@ def workspace_path() -> str:
     1. AEGIS_WORKSPACE_PATH environment variable (explicit override).
     2. /workspace -- the conventional mount point inside an Aegis microVM.
     3. ./workspace -- fallback for local development outside a VM.
+
+    The environment variable is read on every call; the /workspace check for
+    steps 2-3 is done once and cached.
     """
+    global _default_root
     env = os.environ.get("AEGIS_WORKSPACE_PATH")
     if env:
         return env
-    if os.path.isdir("/workspace"):
-        return "/workspace"
-    return "./workspace"
+    if _default_root is None:
+        _default_root = "/workspace" if os.path.isdir("/workspace") else "./workspace"
+    return _default_root
 
 
 def ensure_dirs() -> None:
     """Create the standard workspace subdirectories: data/, output/, .cache/."""
     root = workspace_path()
-    os.makedirs(os.path.join(root, "data"), exist_ok=True)
-    os.makedirs(os.path.join(root, "output"), exist_ok=True)
-    os.makedirs(os.path.join(root, ".cache"), exist_ok=True)
+    # Walk/create the root once; the subdirectories then need one stat each,
+    # plus a single mkdir when missing.
+    os.makedirs(root, exist_ok=True)
+    for sub in ("data", "output", ".cache"):
+        path = f"{root}/{sub}"
+        if os.path.isdir(path):
+            continue
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            # Created concurrently is fine; a file in the way is not.
+            if not os.path.isdir(path):
+                raise
 
 
 def data_path() -> str:
     """Return workspace_path()/data."""
-    return os.path.join(workspace_path(), "data")
+    return f"{workspace_path()}/data"
 
 
 def output_path() -> str:
     """Return workspace_path()/output."""
-    return os.path.join(workspace_path(), "output")
+    return f"{workspace_path()}/output"
 
 
 def cache_path() -> str:
     """Return workspace_path()/.cache."""
-    return os.path.join(workspace_path(), ".cache")
+    return f"{workspace_path()}/.cache"
@@ -3,6 +3,7 @@
 import io
 import json
 import sys
+from datetime import datetime, timedelta, timezone
 
 from aegis import log
 
@@ -96,3 +97,188 @@ def test_output_is_single_line(monkeypatch):
 
     lines = buf.getvalue().splitlines()
     assert len(lines) == 1
+
+
+def test_non_ascii_preserved(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info("héllo ✓", city="Zürich")
+
+    assert "héllo ✓" in buf.getvalue()
+    record = json.loads(buf.getvalue())
+    assert record["msg"] == "héllo ✓"
+    assert record["city"] == "Zürich"
+
+
+def test_stdlib_fallback_without_orjson(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+    monkeypatch.setattr(log, "orjson", None)
+
+    log.info("fallback", status=200)
+
+    record = json.loads(buf.getvalue())
+    assert record["msg"] == "fallback"
+    assert record["status"] == 200
+    assert record["ts"].endswith("+00:00")
+
+
+def test_log_line_ordered_after_buffered_print(monkeypatch):
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    print("before", file=stream)
+    log.info("after")
+    stream.flush()
+
+    lines = raw.getvalue().decode().splitlines()
+    assert lines[0] == "before"
+    assert json.loads(lines[1])["msg"] == "after"
+
+
+def test_file_backed_stream_written_via_fd(monkeypatch, tmp_path):
+    path = tmp_path / "out.log"
+    with open(path, "w", encoding="utf-8") as stream:
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        print("before", file=stream)
+        log.info("first")
+        log.info("second", n=2)
+        monkeypatch.setattr(log, "orjson", None)
+        log.info("third")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "before"
+    assert [json.loads(line)["msg"] for line in lines[1:]] == ["first", "second", "third"]
+
+
+def test_ts_is_utc_iso8601_with_microseconds(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info("tick")
+
+    ts = json.loads(buf.getvalue())["ts"]
+    parsed = datetime.fromisoformat(ts)
+    assert parsed.utcoffset() == timedelta(0)
+    assert abs(datetime.now(timezone.utc) - parsed) < timedelta(seconds=5)
+    assert len(ts) == len("2026-01-01T00:00:00.000000+00:00")
+
+
+def test_ts_reformatted_on_second_rollover(monkeypatch):
+    times = iter([1700000000_250000000, 1700000000_500000999, 1700000001_125000000])
+    monkeypatch.setattr(log.time, "time_ns", lambda: next(times))
+
+    assert log._timestamp() == "2023-11-14T22:13:20.250000+00:00"
+    assert log._timestamp() == "2023-11-14T22:13:20.500000+00:00"
+    assert log._timestamp() == "2023-11-14T22:13:21.125000+00:00"
+
+
+def test_extra_kwargs_override_base_keys(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info("hello", ts="custom", user="bob")
+
+    line = buf.getvalue()
+    assert line.count('"ts"') == 1
+    record = json.loads(line)
+    assert record["ts"] == "custom"
+    assert record["user"] == "bob"
+
+
+def test_msg_is_json_escaped(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info('say "hi"\nbye', path="/a\\b")
+
+    lines = buf.getvalue().splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["msg"] == 'say "hi"\nbye'
+    assert record["path"] == "/a\\b"
+
+
+def test_stdlib_fallback_escapes_and_overrides(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+    monkeypatch.setattr(log, "orjson", None)
+
+    log.info('say "hi"\nbye', city="Zürich")
+    log.info("hello", ts="custom")
+
+    first, second = buf.getvalue().splitlines()
+    assert json.loads(first) == {
+        "level": "info",
+        "msg": 'say "hi"\nbye',
+        "ts": json.loads(first)["ts"],
+        "city": "Zürich",
+    }
+    assert second.count('"ts"') == 1
+    assert json.loads(second)["ts"] == "custom"
+
+
+def test_non_str_nested_keys(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info("counts", counts={1: 2, "a": {3: "x"}})
+
+    record = json.loads(buf.getvalue())
+    assert record["counts"] == {"1": 2, "a": {"3": "x"}}
+
+
+def test_int_wider_than_64_bits(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info("big", n=2**70)
+
+    record = json.loads(buf.getvalue())
+    assert record["msg"] == "big"
+    assert record["n"] == 2**70
+
+
+def test_lone_surrogate_to_text_stream(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
+
+    log.info("file \udcff.txt", name="\udcfe")
+    monkeypatch.setattr(log, "orjson", None)
+    log.info("file \udcff.txt", name="\udcfe")
+    log.info("plain \udcff")
+
+    records = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert [r["msg"] for r in records] == ["file \udcff.txt", "file \udcff.txt", "plain \udcff"]
+    assert records[0]["name"] == "\udcfe"
+
+
+def test_lone_surrogate_to_fd_stream_uses_stream_errors(monkeypatch, tmp_path):
+    path = tmp_path / "out.log"
+    with open(path, "w", encoding="utf-8", errors="surrogateescape") as stream:
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        log.info("file \udcff.txt")
+        monkeypatch.setattr(log, "orjson", None)
+        log.info("plain \udcff")
+
+    lines = path.read_bytes().splitlines()
+    assert b'"msg":"file \xff.txt"' in lines[0]
+    assert b'"msg":"plain \xff"' in lines[1]
+
+
+def test_fd_stream_uses_stream_encoding(monkeypatch, tmp_path):
+    path = tmp_path / "out.log"
+    with open(path, "w", encoding="latin-1") as stream:
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        log.info("café")
+        monkeypatch.setattr(log, "orjson", None)
+        log.info("crème", city="Zürich")
+
+    lines = path.read_bytes().splitlines()
+    assert json.loads(lines[0].decode("latin-1"))["msg"] == "café"
+    assert json.loads(lines[1].decode("latin-1"))["city"] == "Zürich"
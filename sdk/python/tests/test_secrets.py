@@ -2,7 +2,12 @@
 
 import pytest
 
-from aegis.secrets import AegisSecretError, get_secret, require_secret
+from aegis.secrets import (
+    AegisSecretError,
+    get_secret,
+    get_secret_cached,
+    require_secret,
+)
 
 
 def test_get_secret_returns_value(monkeypatch):
@@ -15,6 +20,30 @@ def test_get_secret_returns_none_when_missing(monkeypatch):
     assert get_secret("NONEXISTENT_SECRET") is None
 
 
+def test_get_secret_cached_returns_value(monkeypatch):
+    get_secret_cached.cache_clear()
+    monkeypatch.setenv("CACHED_KEY", "first")
+    assert get_secret_cached("CACHED_KEY") == "first"
+
+
+def test_get_secret_cached_keeps_first_value(monkeypatch):
+    get_secret_cached.cache_clear()
+    monkeypatch.setenv("CACHED_KEY", "first")
+    assert get_secret_cached("CACHED_KEY") == "first"
+
+    monkeypatch.setenv("CACHED_KEY", "second")
+    assert get_secret_cached("CACHED_KEY") == "first"
+
+    get_secret_cached.cache_clear()
+    assert get_secret_cached("CACHED_KEY") == "second"
+
+
+def test_get_secret_cached_returns_none_when_missing(monkeypatch):
+    get_secret_cached.cache_clear()
+    monkeypatch.delenv("NONEXISTENT_SECRET", raising=False)
+    assert get_secret_cached("NONEXISTENT_SECRET") is None
+
+
 def test_require_secret_returns_value(monkeypatch):
     monkeypatch.setenv("DB_PASSWORD", "hunter2")
     assert require_secret("DB_PASSWORD") == "hunter2"
@@ -2,6 +2,9 @@
 
 import os
 
+import pytest
+
+from aegis import workspace
 from aegis.workspace import (
     cache_path,
     data_path,
@@ -26,6 +29,21 @@ def test_workspace_path_local_fallback(monkeypatch):
         assert workspace_path() == "./workspace"
 
 
+def test_workspace_path_probes_mount_once(monkeypatch):
+    """The /workspace check is cached; the env override is still read each call."""
+    monkeypatch.delenv("AEGIS_WORKSPACE_PATH", raising=False)
+    monkeypatch.setattr(workspace, "_default_root", None)
+    calls = []
+    monkeypatch.setattr(os.path, "isdir", lambda p: calls.append(p) or True)
+
+    assert workspace_path() == "/workspace"
+    assert workspace_path() == "/workspace"
+    assert calls == ["/workspace"]
+
+    monkeypatch.setenv("AEGIS_WORKSPACE_PATH", "/elsewhere")
+    assert workspace_path() == "/elsewhere"
+
+
 def test_ensure_dirs_creates_subdirectories(monkeypatch, tmp_path):
     """ensure_dirs() creates data/, output/, and .cache/ under the workspace root."""
     root = str(tmp_path / "ws")
@@ -47,6 +65,30 @@ def test_ensure_dirs_idempotent(monkeypatch, tmp_path):
     ensure_dirs()  # must not raise
 
 
+def test_ensure_dirs_fills_in_missing_subdirectories(monkeypatch, tmp_path):
+    """An existing workspace with some subdirectories gets the rest created."""
+    root = tmp_path / "ws"
+    (root / "data").mkdir(parents=True)
+    (root / "data" / "keep.txt").write_text("x")
+    monkeypatch.setenv("AEGIS_WORKSPACE_PATH", str(root))
+
+    ensure_dirs()
+
+    assert (root / "data" / "keep.txt").read_text() == "x"
+    assert (root / "output").is_dir()
+    assert (root / ".cache").is_dir()
+
+
+def test_ensure_dirs_rejects_file_in_place_of_directory(monkeypatch, tmp_path):
+    root = tmp_path / "ws"
+    root.mkdir()
+    (root / "output").write_text("not a dir")
+    monkeypatch.setenv("AEGIS_WORKSPACE_PATH", str(root))
+
+    with pytest.raises(FileExistsError):
+        ensure_dirs()
+
+
 def test_data_path(monkeypatch, tmp_path):
     monkeypatch.setenv("AEGIS_WORKSPACE_PATH", str(tmp_path))
     assert data_path() == os.path.join(str(tmp_path), "data")